@@ -1,6 +1,9 @@
 from __future__ import annotations 
 from enum import Enum
-from geopy.distance import great_circle
+from math import radians, sin, cos, atan2, sqrt
+
+
+EARTH_RADIUS: float = 6371.009 # mean radius of the earth in kilometers
 
 
 class CapitalType(Enum):
@@ -16,15 +19,22 @@ class CapitalType(Enum):
         return self.value
 
 
+_capital_types: dict[str, CapitalType] = dict(CapitalType.__members__) # a dict that associates capital type names to members.
+
+
 class Country():
     """
     Represents a country.
     """
 
+    __slots__ = ("name", "iso3", "cities", "_cities_by_name", "_cities_by_capital_type")
+
     countries: dict[str, Country] = dict() # a dict that associates country names to instances.
     name: str
     iso3: str
     cities: list[City]
+    _cities_by_name: dict[str, City] # a dict that associates city names to instances in this country.
+    _cities_by_capital_type: dict[CapitalType, list[City]] # a dict that groups the cities of this country by capital type.
 
     def __init__(self, name: str, iso3: str) -> None:
         """
@@ -33,6 +43,8 @@ class Country():
         self.name = name
         self.iso3 = iso3.upper()
         self.cities = []
+        self._cities_by_name = {}
+        self._cities_by_capital_type = {}
         Country.countries[name] = self
 
     def _add_city(self, city: City):
@@ -41,6 +53,10 @@ class Country():
         """
         self.cities.append(city)
 
+        # index the city, keeping the first city if there are multiple cities of the same name
+        self._cities_by_name.setdefault(city.name, city)
+        self._cities_by_capital_type.setdefault(city.capital_type, []).append(city)
+
     def get_cities(self, capital_types: list[CapitalType] = None) -> list[City]:
         """
         Returns a list of cities of this country.
@@ -48,13 +64,19 @@ class Country():
         The argument capital_types can be given to specify a subset of the capital types that must be returned.
         Cities that do not correspond to these capital types are not returned.
         If no argument is given, all cities are returned.
+        Cities are returned in the order they were added to the country.
         """
         # if capital_types not specified, return a all cities
         if not capital_types:
             return self.cities
 
-        # if capital_types specified, filter and return a list of cities
-        return list(filter(lambda city: city.capital_type in capital_types, self.cities))
+        # if a single capital type is specified, its cities are already grouped in the order they were added
+        capital_types = set(capital_types)
+        if len(capital_types) == 1:
+            return list(self._cities_by_capital_type.get(capital_types.pop(), []))
+
+        # if multiple capital types are specified, keep the cities in the order they were added
+        return [city for city in self.cities if city.capital_type in capital_types]
 
     def get_city(self, city_name: str) -> City:
         """
@@ -62,11 +84,7 @@ class Country():
         Returns None if there is no city by this name.
         If there are multiple cities of the same name, returns an arbitrary one.
         """
-        cities = list(filter(lambda city: city.name == city_name, self.cities))
-        if not cities:
-            return None
-        
-        return cities[0]
+        return self._cities_by_name.get(city_name)
 
     def __str__(self) -> str:
         """
@@ -80,12 +98,19 @@ class City():
     Represents a city.
     """
 
+    __slots__ = ("name", "coordinate", "_sin_lat", "_cos_lat", "_lng_rad", "capital_type", "country", "city_id", "_search_key")
+
     name: str
     cities: dict[str, City] = dict() # a dict that associates city IDs to instances.
+    search_index: dict[str, list[City]] = dict() # a dict that associates every 3 letter sequence of the lowercased city strings to the cities containing it.
     coordinate: tuple[float, float] # a vector for the coordinate. [0] is latitude, and [1] is longitude
+    _sin_lat: float # sine of the latitude, precomputed for distance calculations
+    _cos_lat: float # cosine of the latitude, precomputed for distance calculations
+    _lng_rad: float # longitude in radians, precomputed for distance calculations
     capital_type: CapitalType
     country: Country
     city_id: str
+    _search_key: str # the lowercased string of the city, precomputed for searching
 
     def __init__(self, name: str, latitude: str, longitude: str, country: str, capital_type: str, city_id: str) -> None:
         """
@@ -94,26 +119,40 @@ class City():
 
         self.name = name
         self.coordinate = (float(latitude), float(longitude))
+
+        # precompute the trigonometry used by distance calculations
+        self._sin_lat = sin(radians(self.coordinate[0]))
+        self._cos_lat = cos(radians(self.coordinate[0]))
+        self._lng_rad = radians(self.coordinate[1])
+
         self.country = Country.countries[country]
         self.city_id = city_id
+
+        # if a city of this id already exists, it is replaced, so stop it from being found by searching
+        previous = City.cities.get(city_id)
+        if previous is not None:
+            for trigram in {previous._search_key[i:i + 3] for i in range(len(previous._search_key) - 2)}:
+                City.search_index[trigram].remove(previous)
+
         City.cities[city_id] = self
 
-        # check if capital type is defined in enum
-        if capital_type in CapitalType.__members__:
-            self.capital_type = CapitalType[capital_type]
-        else:
-            self.capital_type = CapitalType.unspecified
+        # look up capital type in enum, fallback to unspecified if not defined
+        self.capital_type = _capital_types.get(capital_type, CapitalType.unspecified)
 
         # add city to country
         self.country._add_city(self)
 
+        # index the city by every 3 letter sequence of its lowercased string for searching
+        self._search_key = str(self).lower()
+        for trigram in {self._search_key[i:i + 3] for i in range(len(self._search_key) - 2)}:
+            City.search_index.setdefault(trigram, []).append(self)
+
     def distance(self, other_city: City) -> int:
         """
         Returns the distance in kilometers between two cities using the great circle method,
         rounded up to an integer.
         """
-        d = great_circle(self.coordinate, other_city.coordinate).kilometers
-        return round(d)
+        return distances(self, [other_city])[0]
 
     def __str__(self) -> str:
         """
@@ -125,13 +164,74 @@ class City():
     def __repr__(self) -> str:
         """
         Return a string representation of the object in comply with the python convention.
-        For example, City('Melbourne', '-37.8136', '144.9631', 'Australia', 'admin', '1036533631')
+        For example, City('Melbourne', -37.8136, 144.9631, 'Australia', 'admin', '1036533631')
         """
 
-        params = [self.name, self.coordinate[0], self.coordinate[1], self.country.name, self.capital_type.value, self.city_id]
-        params = [repr(str(param)) for param in params]
+        return f"City({self.name!r}, {self.coordinate[0]!r}, {self.coordinate[1]!r}, {self.country.name!r}, {self.capital_type.value!r}, {self.city_id!r})"
+
+
+def great_circle_distances(sin_lat1: float, cos_lat1: float, lng1: float, destinations: list[City]) -> list[float]:
+    """
+    Returns the unrounded distances in kilometers from a coordinate to each of the destination cities
+    using the great circle method.
+    The coordinate is given as the sine and cosine of its latitude and its longitude in radians.
+    The trigonometry of every city is computed once when the city is created,
+    so only the longitude difference has to be evaluated for each pair.
+    """
+    result = []
+    for city in destinations:
+        sin_lat2, cos_lat2 = city._sin_lat, city._cos_lat
+        delta_lng = city._lng_rad - lng1
+        cos_delta_lng, sin_delta_lng = cos(delta_lng), sin(delta_lng)
+
+        d = atan2(sqrt((cos_lat2 * sin_delta_lng) ** 2 +
+                       (cos_lat1 * sin_lat2 - sin_lat1 * cos_lat2 * cos_delta_lng) ** 2),
+                  sin_lat1 * sin_lat2 + cos_lat1 * cos_lat2 * cos_delta_lng)
+        result.append(EARTH_RADIUS * d)
+
+    return result
+
+
+def distances(origin: City, destinations: list[City]) -> list[int]:
+    """
+    Returns the distances in kilometers from the origin city to each of the destination cities
+    using the great circle method, rounded to integers.
+    """
+    d = great_circle_distances(origin._sin_lat, origin._cos_lat, origin._lng_rad, destinations)
+    return [round(i) for i in d]
+
+
+def nearest_city(latitude: float, longitude: float) -> City | None:
+    """
+    Returns the city closest to the given coordinate in degrees.
+    Returns None if there are no cities.
+    If multiple cities are at the same distance, returns an arbitrary one.
+    """
+    cities = list(City.cities.values())
+    if not cities:
+        return None
+
+    latitude = radians(latitude)
+    d = great_circle_distances(sin(latitude), cos(latitude), radians(longitude), cities)
+    return cities[min(range(len(cities)), key=d.__getitem__)]
+
+
+def search_cities(query: str) -> list[City]:
+    """
+    Returns a list of cities where the query appears in the string of the city, ignoring case.
+    For example, "melb" and "(aus)" both match "Melbourne (AUS)".
+    Cities are returned in the order they were created.
+    Only the cities sharing the rarest 3 letter sequence with the query are checked,
+    queries shorter than 3 letters are checked against every city.
+    """
+    query = query.lower()
+
+    if len(query) < 3:
+        candidates = City.cities.values()
+    else:
+        candidates = min((City.search_index.get(query[i:i + 3], []) for i in range(len(query) - 2)), key=len)
 
-        return "City(" + (", ".join(params)) + ")"
+    return [city for city in candidates if query in city._search_key]
 
 
 def create_example_countries_and_cities() -> None:
@@ -2,7 +2,13 @@ from city_country_csv_reader import create_cities_countries_from_CSV
 from locations import create_example_countries_and_cities
 from trip import Trip, create_example_trips
 from mpl_toolkits.basemap import Basemap
+import matplotlib
+
+# maps are only written to files, use the non-interactive backend to skip loading a GUI toolkit
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
+from math import nan
+from functools import lru_cache
 
 
 def determine_limiting_coordinates(trip: Trip) -> tuple[tuple[float]]:
@@ -10,26 +16,12 @@ def determine_limiting_coordinates(trip: Trip) -> tuple[tuple[float]]:
     Given a trip, determines the coordinate at the lowest left and top right corner to frame the points
     Returns a tuple of float containing the lat and lng respectivly.
     """
-    limiting_coord_llcrnr: list[float, float] = None
-    limiting_coord_urcrnr: list[float, float] = None
-    for i in trip:
-        if (not limiting_coord_llcrnr) and (not limiting_coord_urcrnr):
-            limiting_coord_llcrnr = list(i.coordinate)
-            limiting_coord_urcrnr = list(i.coordinate)
-            continue
-
-        if i.coordinate[0] < limiting_coord_llcrnr[0]:
-            limiting_coord_llcrnr[0] = i.coordinate[0]
-        if i.coordinate[1] < limiting_coord_llcrnr[1]:
-            limiting_coord_llcrnr[1] = i.coordinate[1]
-        if i.coordinate[0] > limiting_coord_urcrnr[0]:
-            limiting_coord_urcrnr[0] = i.coordinate[0]
-        if i.coordinate[1] > limiting_coord_urcrnr[1]:
-            limiting_coord_urcrnr[1] = i.coordinate[1]
-
-    # add margins to limiting coords
-    limiting_coord_llcrnr = [i-5 for i in limiting_coord_llcrnr]
-    limiting_coord_urcrnr = [i+5 for i in limiting_coord_urcrnr]
+    latitudes = [i.coordinate[0] for i in trip]
+    longitudes = [i.coordinate[1] for i in trip]
+
+    # find the limiting coords and add margins to them
+    limiting_coord_llcrnr = [min(latitudes) - 5, min(longitudes) - 5]
+    limiting_coord_urcrnr = [max(latitudes) + 5, max(longitudes) + 5]
 
     # checking coordinate delta
     dlat = abs(limiting_coord_llcrnr[0] - limiting_coord_urcrnr[0])
@@ -50,6 +42,20 @@ def determine_limiting_coordinates(trip: Trip) -> tuple[tuple[float]]:
     return tuple(limiting_coord_llcrnr), tuple(limiting_coord_urcrnr)
 
 
+@lru_cache(maxsize=32)
+def get_basemap(projection: str, limiting_coord_llcrnr: tuple[float], limiting_coord_urcrnr: tuple[float],
+                resolution: str = 'l') -> Basemap:
+    """
+    Returns a Basemap framed by the given lowest left and top right corner coordinates (lat and lng).
+    Creating a Basemap loads the coastline data, so the instance is cached
+    and reused when the same projection and frame is requested again.
+    """
+    return Basemap(llcrnrlon=limiting_coord_llcrnr[1], llcrnrlat=limiting_coord_llcrnr[0],
+                   urcrnrlon=limiting_coord_urcrnr[1], urcrnrlat=limiting_coord_urcrnr[0],
+                   lat_0=45, lon_0=-45,
+                   resolution=resolution, projection=projection)
+
+
 def plot_trip(trip: Trip, projection = 'robin', line_width=2, colour='b') -> None:
     """
     Plots a trip on a map and writes it to a file.
@@ -60,18 +66,34 @@ def plot_trip(trip: Trip, projection = 'robin', line_width=2, colour='b') -> Non
     # print(limiting_coord_llcrnr, limiting_coord_urcrnr)
     limiting_coord_llcrnr, limiting_coord_urcrnr = determine_limiting_coordinates(trip)
 
-    # setup mercator map projection.
-    m = Basemap(llcrnrlon=limiting_coord_llcrnr[1], llcrnrlat=limiting_coord_llcrnr[0],
-                urcrnrlon=limiting_coord_urcrnr[1], urcrnrlat=limiting_coord_urcrnr[0],
-                lat_0=45, lon_0=-45,
-                resolution='l', projection=projection)
+    # setup map projection.
+    m = get_basemap(projection, limiting_coord_llcrnr, limiting_coord_urcrnr)
 
-    # plot line graph
+    # join the great circles of every leg into a single line, legs are separated by nan
+    x_points = []
+    y_points = []
     for i in trip.trip_pair():
-        m.drawgreatcircle(i[0].coordinate[1], i[0].coordinate[0],
-                        i[1].coordinate[1], i[1].coordinate[0],
-                        linewidth=line_width, color=colour)
-        
+        # sample a point about every 100km along the great circle, same as drawgreatcircle
+        npoints = round(i[0].distance(i[1]) / 100) + 2
+        x, y = m.gcpoints(i[0].coordinate[1], i[0].coordinate[0],
+                          i[1].coordinate[1], i[1].coordinate[0], npoints)
+
+        for j in range(len(x)):
+            # break the line where it wraps around the edge of the map, i.e. jumps over half the map width
+            if x_points and abs(x[j] - x_points[-1]) > m.xmax / 2:
+                x_points.append(nan)
+                y_points.append(nan)
+            x_points.append(x[j])
+            y_points.append(y[j])
+
+        x_points.append(nan)
+        y_points.append(nan)
+
+    # plot line graph
+    if x_points:
+        m.plot(x_points, y_points, linewidth=line_width, color=colour)
+
+
     m.drawcoastlines()
     m.fillcontinents()
     m.drawstates()
@@ -16,13 +16,15 @@ MessageBox("Navigation System - Loading", "The Navigation System is now initiali
             hide_options=True).display()
 
 # some of these imports takes some time to process, it is better to show a message before importing them.
-from city_country_csv_reader import create_cities_countries_from_CSV
+# path_finding (networkx) and map_plotting (matplotlib and basemap) are the slowest,
+# they are imported where they are first used instead, so the menu appears sooner.
 from vehicles import Vehicle, CrappyCrepeCar, DiplomacyDonutDinghy, TeleportingTarteTrolley
-from path_finding import find_shortest_path
-from locations import City, Country
-from map_plotting import plot_trip
+from locations import City, Country, search_cities
 from trip import Trip
-from time import sleep
+from collections import OrderedDict
+from collections.abc import Iterable
+from weakref import WeakKeyDictionary
+from time import sleep, monotonic
 from math import inf
 import os
 
@@ -35,6 +37,8 @@ class NavigationSystem:
     """
     vehicles: list[Vehicle]
     trips: list[Trip]
+    vehicles_revision: int
+    trips_revision: int
     instance: NavigationSystem = None
     default_source_file: str = "worldcities_truncated.csv"
 
@@ -64,16 +68,50 @@ class NavigationSystem:
         self.vehicles = []
         self.trips = []
 
+        # revisions are increased every time the lists change, so menus can tell when to rebuild
+        self.vehicles_revision = 0
+        self.trips_revision = 0
+
     def initialise_data(self, file_path: str | None = None) -> None:
         """
         Initializes data by reading csv.
         Takes in an optional file_path parameter to specify the file to be read
         if the file_path is None, the default file is being read
         """
+        from city_country_csv_reader import create_cities_countries_from_CSV
+
         if not file_path:
             file_path = NavigationSystem.default_source_file
         create_cities_countries_from_CSV(file_path)
     
+    def add_vehicle(self, vehicle: Vehicle) -> None:
+        """
+        Adds a vehicle to the system.
+        """
+        self.vehicles.append(vehicle)
+        self.vehicles_revision += 1
+
+    def remove_vehicle(self, index: int) -> None:
+        """
+        Removes the vehicle at the given index from the system.
+        """
+        del self.vehicles[index]
+        self.vehicles_revision += 1
+
+    def add_trip(self, trip: Trip) -> None:
+        """
+        Adds a trip to the system.
+        """
+        self.trips.append(trip)
+        self.trips_revision += 1
+
+    def remove_trip(self, index: int) -> None:
+        """
+        Removes the trip at the given index from the system.
+        """
+        del self.trips[index]
+        self.trips_revision += 1
+
     def create_example_entities(self) -> None:
         """
         Adds example vehicles and trips to this system.
@@ -83,36 +121,22 @@ class NavigationSystem:
         """
 
         # add example vehicles
-        self.vehicles += [CrappyCrepeCar(200), DiplomacyDonutDinghy(100, 500), TeleportingTarteTrolley(3, 2000)]
+        for vehicle in [CrappyCrepeCar(200), DiplomacyDonutDinghy(100, 500), TeleportingTarteTrolley(3, 2000)]:
+            self.add_vehicle(vehicle)
+
+        # find the cities used by the example trips
+        cities = {}
+        for country_name, city_name in [("Australia", "Melbourne"), ("Australia", "Canberra"), ("Japan", "Tokyo"),
+                                        ("Malaysia", "Kuala Lumpur"), ("France", "Paris"), ("Switzerland", "Bern")]:
+            cities[city_name] = Country.countries[country_name].get_city(city_name)
 
         # add example trips
-        australia = Country.countries["Australia"]
-        japan = Country.countries["Japan"]
-        malaysia = Country.countries["Malaysia"]
-        switzerland = Country.countries["Switzerland"]
-        france = Country.countries["France"]
-
-        tokyo = japan.get_city("Tokyo")
-        kuala_lumpur = malaysia.get_city("Kuala Lumpur")
-        melbourne = australia.get_city("Melbourne")
-        canberra = australia.get_city("Canberra")
-        paris = france.get_city("Paris")
-        bern = switzerland.get_city("Bern")
-
-        trip1 = Trip(melbourne)
-        trip1.add_next_city(kuala_lumpur)
-        trip1.add_next_city(tokyo)
-        self.trips.append(trip1)
-
-        trip2 = Trip(melbourne)
-        trip2.add_next_city(paris)
-        trip2.add_next_city(bern)
-        self.trips.append(trip2)
-
-        trip3 = Trip(melbourne)
-        trip3.add_next_city(canberra)
-        trip3.add_next_city(kuala_lumpur)
-        self.trips.append(trip3)
+        for city_names in [("Melbourne", "Kuala Lumpur", "Tokyo"), ("Melbourne", "Paris", "Bern"),
+                           ("Melbourne", "Canberra", "Kuala Lumpur")]:
+            trip = Trip(cities[city_names[0]])
+            for city_name in city_names[1:]:
+                trip.add_next_city(cities[city_name])
+            self.add_trip(trip)
 
 class LocationSelectionMenu(SimpleMenuUserInterface):
     """
@@ -137,13 +161,12 @@ class LocationSelectionMenu(SimpleMenuUserInterface):
         Returns a tuple of the result in boolean and the error message in string if applicable.
         """
         
-        try:
-            trimmed = raw.strip()
-            assert trimmed, "Filter value cannot be empty"
-            assert len(trimmed) >= 3, "Filter value has to be 3 characters or above"
-            return True, ""
-        except AssertionError as e:
-            return False, str(e)
+        trimmed = raw.strip()
+        if not trimmed:
+            return False, "Filter value cannot be empty"
+        if len(trimmed) < 3:
+            return False, "Filter value has to be 3 characters or above"
+        return True, ""
 
     def get_filter(self, err_msg: str | None = None) -> str:
         """
@@ -173,8 +196,7 @@ class LocationSelectionMenu(SimpleMenuUserInterface):
             if not city_filter:
                 return
             
-            cities = list(City.cities.values())
-            filtered = list(filter(lambda city: city_filter.lower() in str(city).lower(), cities))
+            filtered = search_cities(city_filter)
 
             # if only one city is found, return that city
             if len(filtered) == 1:
@@ -188,12 +210,7 @@ class LocationSelectionMenu(SimpleMenuUserInterface):
             filter_empty_err = None
 
             # display the multiple choice of cities
-            self.options = {
-                1: "[Search again...]"
-            }
-
-            for i in range(len(filtered)):
-                self.options[i + 2] = str(filtered[i])
+            self.options = {1: "[Search again...]", **{i + 2: str(city) for i, city in enumerate(filtered)}}
 
             self.display()
             option = self.wait_for_interact()
@@ -241,7 +258,7 @@ class MainMenu(SimpleMenuUserInterface):
             self.display()
             option = self.wait_for_interact()
 
-            if option in self.options.keys():
+            if option in self.options:
                 self.input_err = None
 
             # open menu when corresponding option is selected
@@ -265,17 +282,26 @@ class ManageVehiclesMenu(SimpleMenuUserInterface):
     The user will be able to add new vehicles or manage current available vehicles.
     """
 
+    vehicles_revision: int
+
     def __init__(self) -> None:
         """
         initialize a simple menu interface.
         """
 
-        system = NavigationSystem.get_instance()
-        options = {}
-        options[1] = "[Add Vehicle...]"
+        undo_prompt = "(Press Ctrl-C to go back to Main Menu)"
+
+        super().__init__({}, title="Manage Vehicles", undo_prompt=undo_prompt)
+        self.update_options()
 
-        for i in range(len(system.vehicles)):
-            options[i + 2] = str(system.vehicles[i])
+    def update_options(self) -> None:
+        """
+        Rebuild the options and description from the vehicles in the system,
+        and record the revision of the vehicle list they are built from.
+        """
+
+        system = NavigationSystem.get_instance()
+        options = {1: "[Add Vehicle...]", **{i + 2: str(vehicle) for i, vehicle in enumerate(system.vehicles)}}
         
         if len(options) > 1:
             description = "To get started, select a vehicle from the menu below,\n"\
@@ -284,18 +310,20 @@ class ManageVehiclesMenu(SimpleMenuUserInterface):
             description = "There is no vehicles yet.\n"\
                         + "Please select 'Add Vehicle...' to add a custom vehicle"
 
-        undo_prompt = "(Press Ctrl-C to go back to Main Menu)"
-
-        super().__init__(options, title="Manage Vehicles", description=description, undo_prompt=undo_prompt)
+        self.options = options
+        self.description = description
+        self.vehicles_revision = system.vehicles_revision
 
     def execute(self) -> None:
         """
         Executes this UI element until back is selected using Ctrl-C.
         """
 
+        system = NavigationSystem.get_instance()
         while True:
-            # Update options and display
-            self.__init__()
+            # Update options if the vehicles have changed, and display
+            if self.vehicles_revision != system.vehicles_revision:
+                self.update_options()
             self.display()
             option = self.wait_for_interact()
 
@@ -303,13 +331,15 @@ class ManageVehiclesMenu(SimpleMenuUserInterface):
             if not option:
                 return
 
+            self.input_err = None
+
             # if add vehicle is selected, run the add vehicle menu
             if option == 1:
                 AddVehicleVehicleTypeMenu().execute()
                 continue
 
             # or else enter vehicle details page for the specific vehicle selected by the user
-            vehicle = NavigationSystem.get_instance().vehicles[option - 2]
+            vehicle = system.vehicles[option - 2]
             SpecificVehicleMenu(vehicle, option - 2).execute()
 
 class SpecificVehicleMenu(SimpleMenuUserInterface):
@@ -351,7 +381,7 @@ class SpecificVehicleMenu(SimpleMenuUserInterface):
 
         # if delete is selected, delete the vehicle in system
         if option == 1:
-            del NavigationSystem.get_instance().vehicles[self.index]
+            NavigationSystem.get_instance().remove_vehicle(self.index)
 
 class AddVehicleVehicleTypeMenu(ProgressedMenuUserInterface):
     """
@@ -473,25 +503,30 @@ class AddVehicleAttributeMenu(ProgressedMenuUserInterface):
     and save the vehicle to the list.
     """
     vehicle_type: str
-    vehicle_parameters: dict[str, list[str]] = {
-        "CrappyCrepeCar": ["speed"],
-        "DiplomacyDonutDinghy": ["speed_internal", "speed_external"],
-        "TeleportingTarteTrolley": ["timeout", "distance_limit"],
+    vehicle_parameters: dict[str, tuple[str, ...]] = {
+        "CrappyCrepeCar": ("speed",),
+        "DiplomacyDonutDinghy": ("speed_internal", "speed_external"),
+        "TeleportingTarteTrolley": ("timeout", "distance_limit"),
     }
-    options: dict[str, dict[int, str]] = {
-        "CrappyCrepeCar": {
-            1: "Speed of this CrappyCrepeCar (km/h)"
-        },
-        "DiplomacyDonutDinghy": {
-            1: "Speed with in country (km/h)",
-            2: "Speed across countries (km/h)"
-        },
-        "TeleportingTarteTrolley": {
-            1: "Travel time for this TeleportingTarteTrolley (hour)",
-            2: "Maximum distance this TeleportingTarteTrolley can travel (km)"
-        },
+    # option labels of the parameters, in the same order as vehicle_parameters
+    options: dict[str, tuple[str, ...]] = {
+        "CrappyCrepeCar": (
+            "Speed of this CrappyCrepeCar (km/h)",
+        ),
+        "DiplomacyDonutDinghy": (
+            "Speed with in country (km/h)",
+            "Speed across countries (km/h)",
+        ),
+        "TeleportingTarteTrolley": (
+            "Travel time for this TeleportingTarteTrolley (hour)",
+            "Maximum distance this TeleportingTarteTrolley can travel (km)",
+        ),
     }
 
+    # parsed once when the class is created, as these labels never change
+    not_specified_label: str = parse(" §R§1(Not specified)§0")
+    specified_label: str = parse(" §G(Specified)§0")
+
     def __init__(self, vehicle_type: str):
         """
         takes in a vehicle_type as string
@@ -507,9 +542,8 @@ class AddVehicleAttributeMenu(ProgressedMenuUserInterface):
 
         undo_prompt = "(Press Ctrl-C to go back to previous step)"
 
-        options = dict(AddVehicleAttributeMenu.options[vehicle_type])
-        for i in options.keys():
-            options[i] += parse(" §R§1(Not specified)§0")
+        labels = AddVehicleAttributeMenu.options[vehicle_type]
+        options = {i + 1: labels[i] + AddVehicleAttributeMenu.not_specified_label for i in range(len(labels))}
         options[len(options) + 1] = "Confirm"
         options[len(options) + 1] = "Go back to previous step"
 
@@ -524,13 +558,13 @@ class AddVehicleAttributeMenu(ProgressedMenuUserInterface):
         try:
             # try to convert raw input to int
             raw = int(raw)
-            # check for positivity
-            assert raw > 0, "Please enter a non-zero positive integer."
-            return True, ""
         except ValueError:
             return False, "Please enter an integer"
-        except AssertionError as e:
-            return False, str(e)
+
+        # check for positivity
+        if raw <= 0:
+            return False, "Please enter a non-zero positive integer."
+        return True, ""
 
     def execute(self) -> bool:
         """
@@ -544,6 +578,7 @@ class AddVehicleAttributeMenu(ProgressedMenuUserInterface):
         # get the parameters required by this vehicle type
         vehicle_parameters = AddVehicleAttributeMenu.vehicle_parameters[self.vehicle_type]
         parameters = {}  # dict stores parameters entered by user
+        system = NavigationSystem.get_instance()
         while True:
             self.display()
             option = self.wait_for_interact()
@@ -568,7 +603,7 @@ class AddVehicleAttributeMenu(ProgressedMenuUserInterface):
                     vehicle = TeleportingTarteTrolley(parameters["timeout"], parameters["distance_limit"])
 
                 # add vehicle
-                NavigationSystem.get_instance().vehicles.append(vehicle)
+                system.add_vehicle(vehicle)
 
                 # show success message
                 MessageBox("Information", "Vehicle has been added to your list.", "Confirm").execute()
@@ -606,27 +641,37 @@ class AddVehicleAttributeMenu(ProgressedMenuUserInterface):
 
             # store the user entered value and update the option to show specified instead of not specified
             parameters[vehicle_parameters[option - 1]] = int(result)
-            self.options[option] = AddVehicleAttributeMenu.options[self.vehicle_type][option] + parse(" §G(Specified)§0")
+            self.options[option] = AddVehicleAttributeMenu.options[self.vehicle_type][option - 1] + AddVehicleAttributeMenu.specified_label
 
 class ManageTripsMenu(SimpleMenuUserInterface):
     """
     The UI menu for managing trips.
     The user will be able to plan a new trip or manage current available trips.
     """
+
+    trips_revision: int
     
     def __init__(self) -> None:
         """
         initialize a simple menu interface.
         """
 
+        # define an undo prompt
+        undo_prompt = "(Press Ctrl-C to go back to Main Menu)"
+
+        super().__init__({}, title="Manage Trips", undo_prompt=undo_prompt)
+        self.update_options()
+
+    def update_options(self) -> None:
+        """
+        Rebuild the options and description from the trips in the system,
+        and record the revision of the trip list they are built from.
+        """
+
         # define the options for this menu
         system = NavigationSystem.get_instance()
-        options = {}
-        options[1] = "[Plan a New Trip...]"
-
         # add trips to the options list
-        for i in range(len(system.trips)):
-            options[i + 2] = str(system.trips[i])
+        options = {1: "[Plan a New Trip...]", **{i + 2: str(trip) for i, trip in enumerate(system.trips)}}
         
         # define description depends on whether trip menu is empty or not
         if len(options) > 1:
@@ -636,18 +681,20 @@ class ManageTripsMenu(SimpleMenuUserInterface):
             description = "There is no trips yet.\n"\
                         + "Please select 'Plan a New Trip...' to add a custom vehicle"
 
-        # define an undo prompt
-        undo_prompt = "(Press Ctrl-C to go back to Main Menu)"
-
-        super().__init__(options, title="Manage Trips", description=description, undo_prompt=undo_prompt)
+        self.options = options
+        self.description = description
+        self.trips_revision = system.trips_revision
 
     def execute(self) -> None:
         """
         Executes this UI element until back is selected using Ctrl-C.
         """
         
+        system = NavigationSystem.get_instance()
         while True:
-            self.__init__()
+            # Update options if the trips have changed, and display
+            if self.trips_revision != system.trips_revision:
+                self.update_options()
             self.display()
             option = self.wait_for_interact()
 
@@ -655,10 +702,11 @@ class ManageTripsMenu(SimpleMenuUserInterface):
             if not option:
                 return
 
+            self.input_err = None
+
             # if new trip is selected
             if option == 1:
                 # check if there is any vehicle in system, if not, show error message
-                system = NavigationSystem.get_instance()
                 if not system.vehicles:
                     message = "There are no vehicles in this system yet.\n"\
                             + "Atleast one vehicle is required to plan a trip.\n"\
@@ -671,7 +719,6 @@ class ManageTripsMenu(SimpleMenuUserInterface):
                 continue
 
             # if a trip is selected, show trip detail menu
-            system = NavigationSystem.get_instance()
             trip = system.trips[option - 2]
             SpecificTripMenu(trip, option - 2).execute()
 
@@ -765,9 +812,8 @@ class AddTripAutomaticMenu(ProgressedMenuUserInterface):
         undo_prompt = "(Press Ctrl-C to go to previous step)"
 
         # define departure and arrival options and add not specified wording after the label
-        options = dict(AddTripAutomaticMenu.options)
-        for i in options.keys():
-            options[i] += parse(" §R§1(Not Specified)§0")
+        not_specified_label = parse(" §R§1(Not Specified)§0")
+        options = {i: label + not_specified_label for i, label in AddTripAutomaticMenu.options.items()}
 
         # add next and go back options at the end
         options[3] = "Next"
@@ -840,6 +886,12 @@ class AddTripManualMenu(ProgressedMenuUserInterface):
     """
     
     trip: Trip | None
+    trip_revision: int # incremented whenever the trip is modified
+    options_revision: int # the trip revision the options were composed for
+
+    # parsed once when the class is created, as these labels never change
+    departure_label: str = parse(" §B[Departure]§0")
+    arrival_label: str = parse(" §B[Arrive]§0")
 
     def __init__(self) -> None:
         """
@@ -847,6 +899,7 @@ class AddTripManualMenu(ProgressedMenuUserInterface):
         """
 
         self.trip = None
+        self.trip_revision = 0
 
         # define progress
         progress = ["Plan Type", "Choose Locations" , "Choose Vehicle", "Confirm Trip"]
@@ -865,6 +918,7 @@ class AddTripManualMenu(ProgressedMenuUserInterface):
 
         super().__init__(options, progress, 1,
                          title="Plan a New Trip", description=description, undo_prompt=undo_prompt)
+        self.options_revision = self.trip_revision
 
     def get_options(self) -> dict[int, str]:
         """
@@ -880,17 +934,18 @@ class AddTripManualMenu(ProgressedMenuUserInterface):
         
         # add cities to option list
         if self.trip:
-            for i in range(len(self.trip.sequence)):
-                city = self.trip[i]
-                option_text = parse(f"§{self.color}|§0 ") + str(city)
+            bullet = parse(f"§{self.color}|§0 ")
+            last_index = len(self.trip.sequence) - 1
+            for i, city in enumerate(self.trip.sequence):
+                option_text = bullet + str(city)
 
                 # if this is the first city, add departure text at the end
                 if i == 0:
-                    option_text += parse(" §B[Departure]§0")
+                    option_text += AddTripManualMenu.departure_label
                     
                 # if this is the last city, add arrival text at the end
-                elif i == len(self.trip.sequence) - 1:
-                    option_text += parse(" §B[Arrive]§0")
+                elif i == last_index:
+                    option_text += AddTripManualMenu.arrival_label
                 options[i + 3] = option_text
 
         # append confirm and go back option at the end of option list
@@ -907,19 +962,16 @@ class AddTripManualMenu(ProgressedMenuUserInterface):
         return the result as a boolean, and a string as an error message if applicable 
         """
         
-        try:
-            trimmed = raw.strip()
-            
-            # check for empty value
-            assert bool(trimmed), "Value cannot be empty"
-            splitted = trimmed.split(",")
+        trimmed = raw.strip()
+        
+        # check for empty value
+        if not trimmed:
+            return False, "Value cannot be empty"
 
-            # check for all term has more than 3 letters
-            splitted = [i.strip() for i in splitted]
-            assert all(len(i) > 2 for i in splitted), "Every filter term has to be more than 3 letters"
-            return True, ""
-        except AssertionError as e:
-            return False, str(e)
+        # check for all term has more than 3 letters, stopping at the first term that does not
+        if not all(len(i.strip()) > 2 for i in trimmed.split(",")):
+            return False, "Every filter term has to be more than 3 letters"
+        return True, ""
 
     def get_comma_separated_cities(self) -> list[City]:
         """
@@ -946,7 +998,7 @@ class AddTripManualMenu(ProgressedMenuUserInterface):
             for i in raw_splitted:
                 # for every term, find the corresponding city
                 i = i.strip()
-                filtered = list(filter(lambda city: i.lower() in str(city).lower(), City.cities.values()))
+                filtered = search_cities(i)
                 
                 # if city is not found, break and show error message
                 if not filtered:
@@ -970,7 +1022,11 @@ class AddTripManualMenu(ProgressedMenuUserInterface):
         """
 
         while True:
-            self.options = self.get_options()
+            # only compose the options again if the trip has been modified since
+            if self.options_revision != self.trip_revision:
+                self.options = self.get_options()
+                self.options_revision = self.trip_revision
+
             self.display()
             option = self.wait_for_interact()
 
@@ -1003,6 +1059,8 @@ class AddTripManualMenu(ProgressedMenuUserInterface):
                 if not city:
                     continue
 
+                self.trip_revision += 1
+
                 # add city to trip, if trip is not yet defined, define and add
                 if not self.trip:
                     self.trip = Trip(city)
@@ -1014,16 +1072,24 @@ class AddTripManualMenu(ProgressedMenuUserInterface):
             # if append multiple city is selected, use get_comma_separated_cities() to get list of cities from user
             if option == 2:
                 cities = self.get_comma_separated_cities()
-                # add cities to trip, if trip is not defined, define and add
-                if not self.trip:
-                    self.trip = Trip(None)
-                    self.trip.sequence = cities
+
+                # if user cancelled, no city is added
+                if not cities:
                     continue
 
-                self.trip.sequence += cities
+                self.trip_revision += 1
+
+                # add cities to trip, if trip is not defined, define with the first city and add the rest
+                if not self.trip:
+                    self.trip = Trip(cities[0])
+                    cities = cities[1:]
+
+                for city in cities:
+                    self.trip.add_next_city(city)
                 continue
 
             # if a city is selected, the city will be removed from the trip
+            self.trip_revision += 1
             if len(self.trip.sequence) == 1:
                 self.trip = None
                 continue
@@ -1062,9 +1128,7 @@ class AddTripVehicleSelectionMenu(ProgressedMenuUserInterface):
 
         # get a list of vehicles to form an menu option list
         system = NavigationSystem.get_instance()
-        options = {}
-        for i in range(len(system.vehicles)):
-            options[i + 1] = str(system.vehicles[i])
+        options = {i + 1: str(vehicle) for i, vehicle in enumerate(system.vehicles)}
 
         # add go back option to the option list
         options[len(system.vehicles) + 1] = "Go back to previous step"
@@ -1081,6 +1145,7 @@ class AddTripVehicleSelectionMenu(ProgressedMenuUserInterface):
         or if it got discard.
         """
         
+        system = NavigationSystem.get_instance()
         while True:
             self.display()
             option = self.wait_for_interact()
@@ -1090,7 +1155,6 @@ class AddTripVehicleSelectionMenu(ProgressedMenuUserInterface):
                 return False
             
             # get selected vehicle
-            system = NavigationSystem.get_instance()
             vehicle = system.vehicles[option - 1]
             
             # execute the next step, if the next step returns true, return true
@@ -1108,6 +1172,15 @@ class AddTripConfirmTripMenu(ProgressedMenuUserInterface):
     trip: Trip
     trip_type: str
     vehicle: Vehicle
+    # a dict that associates vehicles to the number of cities when their trips were generated,
+    # and to the cities of the generated trip for each departure and arrival, least recently used first.
+    # vehicles are referenced weakly, so the trips (and graph) of a deleted vehicle are freed with it.
+    shortest_paths: WeakKeyDictionary[Vehicle, tuple[int, OrderedDict[tuple[City, City], list[City] | None]]] = WeakKeyDictionary()
+    shortest_paths_size: int = 128 # the maximum number of generated trips kept for each vehicle
+
+    # parsed once when the class is created, as this label never changes
+    impossible_label: str = parse("§RImpossible§0\n\n")\
+                          + parse("§RNote that this trip is impossible for selected vehicle, but you still can add this to your list.§0")
 
     def __init__(self, trip: Trip, trip_type: str, vehicle: Vehicle) -> None:
         """
@@ -1157,34 +1230,58 @@ class AddTripConfirmTripMenu(ProgressedMenuUserInterface):
             try:
                 # generate trip if automatic, listen for ctrl-c to cancel
                 if self.trip_type == "automatic":
-                    calculated_trip = find_shortest_path(self.vehicle, self.trip[0], self.trip[1])
+                    # only generate the trip if it has not been generated for this vehicle and these cities before
+                    # discard the generated trips of this vehicle if the number of cities has changed since
+                    city_count = len(City.cities)
+                    cached = AddTripConfirmTripMenu.shortest_paths.get(self.vehicle)
+                    if cached is None or cached[0] != city_count:
+                        cached = (city_count, OrderedDict())
+                        AddTripConfirmTripMenu.shortest_paths[self.vehicle] = cached
+                    paths = cached[1]
+
+                    key = (self.trip[0], self.trip[1])
+                    if key in paths:
+                        paths.move_to_end(key)
+                    else:
+                        from path_finding import find_shortest_path
+                        calculated_trip = find_shortest_path(self.vehicle, *key)
+                        paths[key] = calculated_trip.sequence if calculated_trip else None
+
+                        # evict the least recently used trip if there are too many
+                        if len(paths) > AddTripConfirmTripMenu.shortest_paths_size:
+                            paths.popitem(last=False)
+                    sequence = paths[key]
                     
                     # show an error message if the vehicle selected is not capable for this trip
-                    if not calculated_trip:
+                    if not sequence:
                         warning = "The vehicle you have selected is not capable for this trip.\nPlease select another vehicle or modify the trip."
                         MessageBox("Warning", warning, "Confirm", color="R").execute()
                         return False
 
-                    # save generated trip
-                    self.trip = calculated_trip
+                    # save generated trip as a new trip, so that the cached cities are never modified
+                    self.trip = Trip(sequence[0])
+                    for city in sequence[1:]:
+                        self.trip.add_next_city(city)
 
                 trip_time = self.trip.total_travel_time(self.vehicle)
             except KeyboardInterrupt:
                 return False
 
-            # update description to show trip details
-            self.description = "The trip you have planned is:\n"\
-                             + parse(f" * Trip sequence: §{self.color}{self.trip}§0 \n")\
-                             + parse(f" * Planned using: §{self.color}{self.vehicle}§0\n")\
-                             + f" * Travel time using: "
-            
             # during manual mode
             # if trip is impossible for the selected vehicle, show warning message, but does not stop user from saving
             if trip_time == inf:
-                self.description += parse("§RImpossible§0\n\n")\
-                                 +  parse("§RNote that this trip is impossible for selected vehicle, but you still can add this to your list.§0")
+                travel_time = AddTripConfirmTripMenu.impossible_label
             else:
-                self.description += parse(f"§{self.color}{trip_time} Hour(s)§0")
+                travel_time = parse(f"§{self.color}{trip_time} Hour(s)§0")
+
+            # update description to show trip details
+            self.description = "".join([
+                "The trip you have planned is:\n",
+                parse(f" * Trip sequence: §{self.color}{self.trip}§0 \n"),
+                parse(f" * Planned using: §{self.color}{self.vehicle}§0\n"),
+                " * Travel time using: ",
+                travel_time
+            ])
 
             self.display()
             option = self.wait_for_interact()
@@ -1196,7 +1293,7 @@ class AddTripConfirmTripMenu(ProgressedMenuUserInterface):
             # if confirm, save the trip and show a success message
             if option == 1:
                 system = NavigationSystem.get_instance()
-                system.trips.append(self.trip)
+                system.add_trip(self.trip)
 
                 MessageBox("Information", "Trip has been added to your list.", "Confirm").execute()
 
@@ -1252,10 +1349,10 @@ class SpecificTripMenu(SimpleMenuUserInterface):
         Executes this UI element until back or delete is selected.
         """
 
+        system = NavigationSystem.get_instance()
         while True:
             self.display()
             option = self.wait_for_interact()
-            system = NavigationSystem.get_instance()
             
             # if go back or ctrl-c, return
             if not option or option == 5:
@@ -1263,6 +1360,7 @@ class SpecificTripMenu(SimpleMenuUserInterface):
             
             # if export trip, plot and export as png. Then shows a success message with file path
             if option == 1:
+                from map_plotting import plot_trip
                 plot_trip(self.trip, projection="merc")
                 filename = "map_" + "_".join(i.name for i in self.trip) + ".png"
                 export_message = parse(f"This trip has been exported to the following file:\n'§{self.color}{filename}§0'")
@@ -1302,7 +1400,7 @@ class SpecificTripMenu(SimpleMenuUserInterface):
 
             # if delete is selected, delete the trip
             if option == 4:
-                del system.trips[self.trip_index]
+                system.remove_trip(self.trip_index)
                 return
 
 class SimulationVehicleSelection(SimpleMenuUserInterface):
@@ -1324,15 +1422,14 @@ class SimulationVehicleSelection(SimpleMenuUserInterface):
         super().__init__({})
         self.trip = trip
 
-        # filter out all capable vehicles
+        # filter out all capable vehicles, the city pairs of the trip are shared by every vehicle
         all_vehicles = NavigationSystem.get_instance().vehicles
-        self.capable_vehicles = list(filter(lambda vehicle: trip.total_travel_time(vehicle) != inf, all_vehicles))
+        pairs = list(trip.trip_pair())
+        self.capable_vehicles = [vehicle for vehicle in all_vehicles if vehicle.can_complete(pairs)]
 
         # define and add option list with vehicles
-        options = {}
-        for i in range(len(self.capable_vehicles)):
-            options[i + 1] = self.capable_vehicles[i]
-        
+        options = {i + 1: vehicle for i, vehicle in enumerate(self.capable_vehicles)}
+
         # add go back option to the end
         options[len(options) + 1] = "Back to previous step"
 
@@ -1386,12 +1483,22 @@ class SimulationInterface(UserInterface):
     current_iteration: int
     current_index: int
     current_trip: tuple[City, City] | None
+    pairs: list[tuple[City, City]]
+    pair_times: list[int]
     current_trip_total_time: int
     current_trip_iteration: int
     color: str
     title: str
     required_time: int
     started: bool
+    header: str # the title and the description of the simulation, parsed once
+    idle_lines: list[str] # the parsed line of each leg when it is not the current leg
+    active_prefix: str
+    bar_prefix: str
+
+    # parsed once when the class is created, as these texts never change
+    reset: str = parse("§0")
+    warning: str = parse("\n  §1§4§RPlease make sure your terminal size is large enough and maintain constant through out the simulation.§0")
 
     def __init__(self, trip: Trip, vehicle: Vehicle) -> None:
         """
@@ -1408,24 +1515,53 @@ class SimulationInterface(UserInterface):
         self.current_trip_total_time = 0
         self.color = "C"
         self.title = "Trip simulation"
-        self.required_time = self.trip.total_travel_time(vehicle)
+
+        # the legs of the trip and their travel time, computed once for the whole simulation
+        self.pairs = list(self.trip.trip_pair())
+        self.pair_times = [vehicle.compute_travel_time(pair[0], pair[1]) for pair in self.pairs]
+
+        self.required_time = sum(self.pair_times)
         self.started = False
+
+        # parse the text that stays the same throughout the simulation
+        self.header = "\n".join([
+            parse(f"§4§{self.color}Simulating Trip§0"),
+            "  You are simulating the following trip",
+            parse(f"  * Trip: §{self.color}{self.trip}§0"),
+            parse(f"  * Vehicle: §{self.color}{self.vehicle}§0"),
+            parse(f"  * Ratio: §{self.color}1 Hour : 100 ms§0"),
+            parse(f"  * Required time: §{self.color}{self.required_time}hr | {self.required_time/10}s§0"),
+            "  Press Ctrl-C to exit this simulation",
+            ""
+        ])
+        self.idle_lines = [f"   {pair[0]} -> {pair[1]}     " + SimulationInterface.reset for pair in self.pairs]
+        self.active_prefix = parse(f" §{self.color}* ")
+        self.bar_prefix = parse(f"[§{self.color}")
+
         super().__init__()
 
     def display(self) -> None:
         """
         Display the UI element to screen without clearing the screen.
+        The cursor position before the progress bar is saved,
+        so that display_progress() can redraw the progress afterwards.
         """
         
         # display title and description
-        print(parse(f"§4§{self.color}Simulating Trip§0"))
-        print("  You are simulating the following trip")
-        print(parse(f"  * Trip: §{self.color}{self.trip}§0"))
-        print(parse(f"  * Vehicle: §{self.color}{self.vehicle}§0"))
-        print(parse(f"  * Ratio: §{self.color}1 Hour : 100 ms§0"))
-        print(parse(f"  * Required time: §{self.color}{self.required_time}hr | {self.required_time/10}s§0"))
-        print("  Press Ctrl-C to exit this simulation")
-        print("")
+        print(self.header)
+
+        # save the cursor position, and render the progress bar and every city
+        print("\0337", end="")
+        self.display_progress(range(len(self.pairs)))
+
+        # print a warning message
+        print(SimulationInterface.warning)
+
+    def display_progress(self, indexes: Iterable[int]) -> None:
+        """
+        Redraw the progress bar and the cities of the given indexes from the cursor position saved by display().
+        The lines of the other cities are skipped without being redrawn.
+        """
 
         # get progress percentage
         current_percentage = 0
@@ -1441,33 +1577,33 @@ class SimulationInterface(UserInterface):
             if self.current_trip_total_time != 0:
                 current_percentage = (self.current_trip_iteration + 1) / self.current_trip_total_time
 
+        # restore the saved cursor position, and save it again for the next redraw
+        output = ["\0338\0337"]
+
         # render progress bar
         progress_bar_length = 40
         fill_length = int(progress_bar_length * total_percentage)
         blank_length = progress_bar_length - fill_length
-        print(parse(f"[§{self.color}"), end="")
-        print("#" * fill_length, end="")
-        print(parse("§0"), end="")
-        print("_" * blank_length, end="")
-        print(f"] {int(total_percentage * 100)}%")
-
-        print("")
-
-        # list and render city
-        i = 0
-        for pair in self.trip.trip_pair():
-            line = ""
-            line += f"{pair[0]} -> {pair[1]}"
-            if i == self.current_index:
-                line = parse(f" §{self.color}* {line} {int(current_percentage * 100)}% §0")
-            else:
-                line = parse(f"   {line}     §0")
+        output.append(self.bar_prefix)
+        output.append("#" * fill_length)
+        output.append(SimulationInterface.reset)
+        output.append("_" * blank_length)
+        output.append(f"] {int(total_percentage * 100)}%\n")
+
+        output.append("\n")
+
+        # list and render city, moving to the next line without redrawing if not required
+        for i in range(len(self.pairs)):
+            if i in indexes:
+                if i == self.current_index:
+                    output.append(f"{self.active_prefix}{self.pairs[i][0]} -> {self.pairs[i][1]} {int(current_percentage * 100)}% {SimulationInterface.reset}")
+                else:
+                    output.append(self.idle_lines[i])
 
-            print(line)
-            i += 1
+            output.append("\n")
 
-        # print a warning message
-        print(parse("\n  §1§4§RPlease make sure your terminal size is large enough and maintain constant through out the simulation.§0"))
+        sys.stdout.write("".join(output))
+        sys.stdout.flush()
 
     def wait_for_interact(self) -> any:
         """
@@ -1479,25 +1615,36 @@ class SimulationInterface(UserInterface):
             # display the UI and wait for user to begin
             self.clear()
             self.set_cursor(0,0)
-            self.current_trip = list(self.trip.trip_pair())[0]
-            self.current_trip_total_time = self.vehicle.compute_travel_time(self.current_trip[0], self.current_trip[1])
+            self.current_trip = self.pairs[0]
+            self.current_trip_total_time = self.pair_times[0]
             self.display()
 
             input("\nPress Enter to begin simulation.")
 
             self.started = True
+
+            # re-render the UI without clearing, achieved using set_cursor(), and blank out the prompt
+            self.set_cursor(0,0)
+            self.display()
+            blank_line = "\n" + " " * (os.get_terminal_size().columns - 1)
+            print(blank_line)
+            print(blank_line)
+            print(blank_line)
             
             # simulation iteration, each iteration is 1hr (100ms)
+            # every iteration ends 0.1s after the previous one, so the time spent on rendering is not added on top
+            previous_index = self.current_index
+            deadline = monotonic()
             for _ in range(self.required_time):
-                # each iteration will re-render the UI without clearing, achieved using set_cursor()
-                self.set_cursor(0,0)
-                self.display()
-                print("\n" + " " * (os.get_terminal_size().columns - 1))
-                print("\n" + " " * (os.get_terminal_size().columns - 1))
-                print("\n" + " " * (os.get_terminal_size().columns - 1))
+                # each iteration only redraws the progress bar and the cities that changed
+                self.display_progress({previous_index, self.current_index})
+                previous_index = self.current_index
 
-                # simulate the iteration by waiting 0.1s
-                sleep(0.1)
+                # simulate the iteration by waiting until the end of this iteration
+                deadline += 0.1
+                remaining = deadline - monotonic()
+                if remaining > 0:
+                    sleep(remaining)
 
                 # increment iteration by 1
                 self.current_iteration += 1
@@ -1506,12 +1653,12 @@ class SimulationInterface(UserInterface):
                 # if the current city has over
                 if self.current_trip_iteration >= self.current_trip_total_time:
                     # if there are no more city, break
-                    if self.current_index == len(list(self.trip.trip_pair())) - 1:
+                    if self.current_index == len(self.pairs) - 1:
                         break
                     
                     self.current_index += 1
-                    self.current_trip = list(self.trip.trip_pair())[self.current_index]
-                    self.current_trip_total_time = self.vehicle.compute_travel_time(self.current_trip[0], self.current_trip[1])
+                    self.current_trip = self.pairs[self.current_index]
+                    self.current_trip_total_time = self.pair_times[self.current_index]
                     self.current_trip_iteration = 0
 
             # re-render the UI after simulation is done, and wait for user to exit
@@ -1539,7 +1686,12 @@ def file_check(filename: str) -> bool:
     Returns the result as boolean
     """
 
-    return os.path.isfile(filename) and os.access(filename, os.R_OK)
+    # opening the file checks existence, file type and permission at once
+    try:
+        with open(filename, "rb"):
+            return True
+    except OSError:
+        return False
 
 def main() -> int:
     """
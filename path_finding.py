@@ -2,10 +2,16 @@ import city_country_csv_reader
 from locations import City, Country
 from trip import Trip
 from vehicles import Vehicle, create_example_vehicles
-from networkx import dijkstra_path
+from networkx import dijkstra_path, connected_components
 from networkx import Graph as NetworkXGraph
 from networkx.exception import NetworkXNoPath
 from math import inf
+from weakref import WeakKeyDictionary
+
+
+# a dict that associates vehicles to their plotted graph and the number of cities when it was plotted.
+# vehicles are referenced weakly, so the graph of a deleted vehicle is freed with it.
+_graphs: WeakKeyDictionary[Vehicle, tuple[int, NetworkXGraph]] = WeakKeyDictionary()
 
 def plot_graph_for_vehicle(vehicle: Vehicle) -> NetworkXGraph:
     """
@@ -26,26 +32,61 @@ def plot_graph_for_vehicle(vehicle: Vehicle) -> NetworkXGraph:
 
     # get possible edges
     for i in range(n - 1):
-        for j in range(i + 1, n):
-            source = cities[i]
-            destination = cities[j]
+        source = cities[i]
+        destinations = cities[i + 1:]
 
+        # get the travel time to every following city at once
+        weights = vehicle.compute_travel_times(source, destinations)
+
+        for destination, weight in zip(destinations, weights):
             # if edge impossible, next iteration
-            if weight := vehicle.compute_travel_time(source, destination) == inf:
+            if weight == inf:
                 continue
             
             graph.add_edge(source.city_id, destination.city_id, weight=weight)
 
     return graph
 
+def get_graph_for_vehicle(vehicle: Vehicle) -> NetworkXGraph:
+    """
+    Returns the graph of plot_graph_for_vehicle() for a vehicle.
+    The graph is plotted once per vehicle and reused,
+    unless the number of cities has changed since it was plotted.
+    Every node has a "component" attribute, which is equal for nodes connected by a path.
+    """
+    city_count = len(City.cities)
+
+    # plot graph if not plotted before, or if it is outdated
+    if vehicle not in _graphs or _graphs[vehicle][0] != city_count:
+        graph = plot_graph_for_vehicle(vehicle)
+
+        # label the connected component of each city, so that unreachable cities can be rejected without searching
+        for label, component in enumerate(connected_components(graph)):
+            for city_id in component:
+                graph.nodes[city_id]["component"] = label
+
+        _graphs[vehicle] = (city_count, graph)
+
+    return _graphs[vehicle][1]
+
 def find_shortest_path(vehicle: Vehicle, from_city: City, to_city: City) -> Trip:
     """
     Returns a shortest path between two cities for a given vehicle using the Dijkstra Algorithm,
     or None if there is no path.
     """
 
-    # plot graph
-    graph = plot_graph_for_vehicle(vehicle)
+    # if departure and arrival is the same, no search is needed
+    if from_city is to_city:
+        trip = Trip(from_city)
+        trip.add_next_city(to_city)
+        return trip
+
+    # get graph, plotted once per vehicle
+    graph = get_graph_for_vehicle(vehicle)
+
+    # if the cities are in different components of the graph, there is no path
+    if graph.nodes[from_city.city_id]["component"] != graph.nodes[to_city.city_id]["component"]:
+        return None
     
     try:
         # find path using the Dijkstra Algorithm
@@ -55,10 +96,6 @@ def find_shortest_path(vehicle: Vehicle, from_city: City, to_city: City) -> Trip
         trip = Trip(from_city)
         for city_id in path[1:]:
             trip.add_next_city(City.cities[city_id])
-        
-        # if departure and arrival is the same
-        if len(trip.sequence) == 1:
-            trip.sequence += trip.sequence
 
         return trip
 
@@ -25,20 +25,21 @@ class Trip():
         """
         self.sequence.append(city)
 
-    def total_travel_time(self, vehicle: Vehicle) -> float:
+    def total_travel_time(self, vehicle: Vehicle, budget: float = inf) -> float:
         """
         Returns a travel duration for the entire trip for a given vehicle.
         Returns math.inf if any leg (i.e. part) of the trip is not possible.
+        If a budget is given, also returns math.inf as soon as the duration reaches the budget.
         """
 
         total_time = 0
-        for i in range(len(self.sequence) - 1):
-            source = self.sequence[i]
-            destination = self.sequence[i + 1]
+        for source, destination in self.trip_pair():
             time = vehicle.compute_travel_time(source, destination)
             if time == inf:
                 return inf
             total_time += time
+            if total_time >= budget:
+                return inf
 
         return total_time
 
@@ -48,19 +49,22 @@ class Trip():
         If there is a tie, return the first vehicle in the list.
         If the trip is not possible for any of the vehicle, return (None, math.inf).
         """
-        travel_times = [self.total_travel_time(vehicle) for vehicle in vehicles]
+        fastest_vehicle = None
+        minimum = inf
+        for vehicle in vehicles:
+            # only a vehicle faster than the fastest so far can replace it, so stop summing once it is not faster
+            travel_time = self.total_travel_time(vehicle, minimum)
+            if travel_time < minimum:
+                fastest_vehicle = vehicle
+                minimum = travel_time
 
-        if all(i == inf for i in travel_times):
-            return (None, inf)
-        
-        minimum = min(travel_times)
-        for i in range(len(vehicles)):
-            if travel_times[i] == minimum:
-                return vehicles[i], minimum
+        return fastest_vehicle, minimum
 
     def trip_pair(self) -> Iterator[tuple[City]]:
-        for i in range(len(self.sequence) - 1):
-            yield self.sequence[i], self.sequence[i + 1]
+        """
+        Returns an iterator of each pair of consecutive cities (i.e. each leg) of the trip.
+        """
+        return zip(self.sequence, self.sequence[1:])
 
     def __str__(self) -> str:
         """
@@ -69,7 +73,7 @@ class Trip():
         """
 
         # convert each city into string, and join them using an arrow symbol
-        return " -> ".join(str(i) for i in self.sequence)
+        return " -> ".join([str(i) for i in self.sequence])
 
     def __iter__(self) -> Iterator[City]:
         """
@@ -1,7 +1,27 @@
 from abc import ABC, abstractmethod
 from typing import Callable
 from ColorStr import parse
+from functools import lru_cache
 import os
+import sys
+
+
+@lru_cache(maxsize=256)
+def parse_cached(text: str) -> str:
+    """
+    Returns the text parsed by ColorStr.parse(), remembering the recently parsed texts,
+    as the same titles, descriptions and prompts are parsed again on every redraw.
+    """
+    return parse(text)
+
+
+def form_option_lines(options: dict[int, str]) -> list[str]:
+    """
+    Returns a line for each of the options,
+    where the keys are padded to the length of the longest key.
+    """
+    longest_key = max(len(str(i)) for i in options)
+    return [f"  {i:<{longest_key}} - {val}" for i, val in options.items()]
 
 
 class UserInterface(ABC):
@@ -13,6 +33,7 @@ class UserInterface(ABC):
     
     clear: Callable[[], None]
     os_name: str
+    windows_escape_sequences: bool | None = None # whether the windows console supports escape sequences, checked once
     
     def __init__(self) -> None:
         """
@@ -24,22 +45,52 @@ class UserInterface(ABC):
 
         # if os is windows based or dos based
         if self.os_name in ("nt", "dos", "ce"):
-            self.clear = self.__clear_screen_windows
+            # use escape sequences if the console supports them, as the other UI elements do
+            if UserInterface.windows_escape_sequences is None:
+                UserInterface.windows_escape_sequences = UserInterface.__enable_escape_sequences_windows()
+
+            if UserInterface.windows_escape_sequences:
+                self.clear = self.__clear_screen_escape_sequence
+            else:
+                self.clear = self.__clear_screen_windows
 
         # if os is unix-like (i.e., Linux and Mac and etc)
         elif self.os_name == "posix":
-            self.clear = self.__clear_screen_unix
+            self.clear = self.__clear_screen_escape_sequence
 
         # fallback for other system types
         else:
             self.clear = self.__clear_screen_fallback
 
-    def __clear_screen_unix(self) -> None:
+    @staticmethod
+    def __enable_escape_sequences_windows() -> bool:
         """
-        clear screen for unix like systems
+        enable escape sequence processing of the windows console
+        returns whether the console supports escape sequences
         """
 
-        os.system("clear")
+        try:
+            from ctypes import windll, byref, c_ulong
+
+            kernel32 = windll.kernel32
+            handle = kernel32.GetStdHandle(-11) # standard output
+            mode = c_ulong()
+            if not kernel32.GetConsoleMode(handle, byref(mode)):
+                return False
+
+            # set ENABLE_VIRTUAL_TERMINAL_PROCESSING
+            return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+        except (ImportError, AttributeError, OSError):
+            return False
+
+    def __clear_screen_escape_sequence(self) -> None:
+        """
+        clear screen and scrollback, and move the cursor to the top left corner
+        achieved by using the escape sequence, the same output as the clear command
+        """
+
+        sys.stdout.write("\033[H\033[2J\033[3J")
+        sys.stdout.flush()
 
     def __clear_screen_windows(self) -> None:
         """
@@ -61,13 +112,11 @@ class UserInterface(ABC):
         achieved by using the escape sequence
         """
 
-        try:
-            assert y >= 0
-            assert x >= 0
-            print(f"\033[{y};{x}H")
-        except AssertionError:
+        if y < 0 or x < 0:
             raise ValueError(f"Unable to set cursor at {y}, {x}")
 
+        sys.stdout.write(f"\033[{y};{x}H")
+
     @abstractmethod
     def display(self) -> None:
         """
@@ -107,6 +156,7 @@ class GeneralUserInterface(UserInterface):
     allow_undo: bool
     input_err: str | None
     undo_prompt: str
+    input_marker: str # the parsed marker shown before user input
     
     def __init__(self, title: str | None = None, description: str | None = None,
                  color: str = "C", allow_undo: bool = True, input_err: str | None = None,
@@ -124,6 +174,9 @@ class GeneralUserInterface(UserInterface):
         self.input_err = input_err
         self.undo_prompt = undo_prompt
 
+        # parse the input marker once, as the color never changes
+        self.input_marker = parse(f"  §{self.color}>§0 ")
+
 class SimpleMenuUserInterface(GeneralUserInterface):
     """
     Abstract class for simple menu user interface.
@@ -132,6 +185,8 @@ class SimpleMenuUserInterface(GeneralUserInterface):
     """
     
     options: dict[int, str]
+    formatted_options: dict[int, str] | None # a copy of the options when option_lines was formatted
+    option_lines: list[str]
 
     def __init__(self, options: dict[int, str],
                 title: str | None = None, description: str | None = None,
@@ -146,6 +201,8 @@ class SimpleMenuUserInterface(GeneralUserInterface):
                          input_err=None, undo_prompt=undo_prompt)
 
         self.options = options
+        self.formatted_options = None
+        self.option_lines = []
 
     def display(self) -> None:
         """
@@ -153,34 +210,34 @@ class SimpleMenuUserInterface(GeneralUserInterface):
         """
 
         self.clear()
+        output = []
 
-        # print title
+        # add title
         if self.title:
-            print(parse(f"§4§{self.color}{self.title}§0"))
+            output.append(parse_cached(f"§4§{self.color}{self.title}§0"))
 
-        # print title
+        # add description
         if self.description:
-            lines = self.description.splitlines()
-            lines = [parse(f"  " + i) for i in lines]
-            print("\n".join(lines))
-        
-        print("")
+            output += [parse_cached("  " + i) for i in self.description.splitlines()]
         
+        output.append("")
 
-        # print prompt and undo_prompt
-        print("  Please select by typing a number and hit Enter:")
+        # add prompt and undo_prompt
+        output.append("  Please select by typing a number and hit Enter:")
         if self.allow_undo and self.undo_prompt:
-            print(f"  {self.undo_prompt}")
+            output.append(f"  {self.undo_prompt}")
 
-        # print options
-        keys = [str(i) for i in self.options.keys()]
-        longest_key = max(len(i) for i in keys)
-        for i in self.options.keys():
-            val = self.options[i]
-            space_padding = " " * (longest_key - len(str(i)))
-            print(f"  {i}{space_padding} - {val}")
+        # add options, formatted again only if they have changed since the last time
+        if self.options != self.formatted_options:
+            self.formatted_options = dict(self.options)
+            self.option_lines = form_option_lines(self.options)
+        output += self.option_lines
 
-        print("")
+        output.append("")
+
+        # print the whole UI with a single write
+        sys.stdout.write("\n".join(output) + "\n")
+        sys.stdout.flush()
 
     def wait_for_interact(self) -> int | None:
         """
@@ -192,24 +249,25 @@ class SimpleMenuUserInterface(GeneralUserInterface):
         while True:
             # print input error if applicable
             if self.input_err:
-                print(parse(f"  §R{self.input_err}§0"))
+                print(parse_cached(f"  §R{self.input_err}§0"))
 
             try:
                 # get user input
-                raw = input(parse(f"  §{self.color}>§0 "))
+                raw = input(self.input_marker)
 
                 # parse to int
                 val = int(raw)
 
-                # assert value is valid option
-                assert val in self.options.keys(), "You have entered an option not in the list"
+                # check value is valid option
+                if val not in self.options:
+                    self.input_err = "You have entered an option not in the list"
+                    self.display()
+                    continue
+
                 return val
             except ValueError:
                 self.input_err = "You must enter a numerical number"
                 self.display()
-            except AssertionError as e:
-                self.input_err = str(e)
-                self.display()
             except KeyboardInterrupt:
                 # if user press ctrl-c while undo is allowed, return None
                 if self.allow_undo:
@@ -226,12 +284,16 @@ class ProgressedMenuUserInterface(GeneralUserInterface):
     """
     
     options: dict[int, str]
+    formatted_options: dict[int, str] | None # a copy of the options when option_lines was formatted
+    option_lines: list[str]
     progress: list[str]
     current_progress_index: int
     past_color: str
     future_color: str
     current_color: str
     breadcrumbs_color: str
+    breadcrumbs: str | None # the breadcrumbs formed by __form_breadcrumbs()
+    breadcrumbs_index: int | None # the current_progress_index the breadcrumbs were formed for
 
     def __init__(self, options: dict[int, str],
                  progress: list[str], current_progress_index: int,
@@ -248,12 +310,16 @@ class ProgressedMenuUserInterface(GeneralUserInterface):
                          input_err=None, undo_prompt=undo_prompt)
 
         self.options = options
+        self.formatted_options = None
+        self.option_lines = []
         self.progress = progress
         self.current_progress_index = current_progress_index
         self.past_color = past_color
         self.future_color = future_color
         self.current_color = current_color
         self.breadcrumbs_color = breadcrumbs_color
+        self.breadcrumbs = None
+        self.breadcrumbs_index = None
 
     def __form_breadcrumbs(self) -> str:
         """
@@ -286,38 +352,41 @@ class ProgressedMenuUserInterface(GeneralUserInterface):
 
         self.clear()
 
-        # print the progress bar
-        print(self.__form_breadcrumbs())
+        # add the progress bar, formed again only if the progress has changed since the last time
+        if self.breadcrumbs_index != self.current_progress_index:
+            self.breadcrumbs = self.__form_breadcrumbs()
+            self.breadcrumbs_index = self.current_progress_index
+        output = [self.breadcrumbs]
 
-        # print title
-        print("")
+        # add title
+        output.append("")
         if self.title:
             total_steps = len(self.progress)
             current_step = self.current_progress_index + 1
-            print(parse(f"§4§{self.color}{self.title} ({current_step}/{total_steps})§0"))
+            output.append(parse_cached(f"§4§{self.color}{self.title} ({current_step}/{total_steps})§0"))
 
-        # print description
+        # add description
         if self.description:
-            lines = self.description.splitlines()
-            lines = [parse(f"  " + i) for i in lines]
-            print("\n".join(lines))
+            output += [parse_cached("  " + i) for i in self.description.splitlines()]
         
-        print("")
+        output.append("")
         
-        # print prompt and undo_prompt
-        print("  Please select by typing a number and hit Enter:")
+        # add prompt and undo_prompt
+        output.append("  Please select by typing a number and hit Enter:")
         if self.allow_undo and self.undo_prompt:
-            print(f"  {self.undo_prompt}")
+            output.append(f"  {self.undo_prompt}")
 
-        # print options
-        keys = [str(i) for i in self.options.keys()]
-        longest_key = max(len(i) for i in keys)
-        for i in self.options.keys():
-            val = self.options[i]
-            space_padding = " " * (longest_key - len(str(i)))
-            print(f"  {i}{space_padding} - {val}")
+        # add options, formatted again only if they have changed since the last time
+        if self.options != self.formatted_options:
+            self.formatted_options = dict(self.options)
+            self.option_lines = form_option_lines(self.options)
+        output += self.option_lines
 
-        print("")
+        output.append("")
+
+        # print the whole UI with a single write
+        sys.stdout.write("\n".join(output) + "\n")
+        sys.stdout.flush()
 
     def wait_for_interact(self) -> int | None:
         """
@@ -329,25 +398,25 @@ class ProgressedMenuUserInterface(GeneralUserInterface):
         while True:
             # print input error if applicable
             if self.input_err:
-                print(parse(f"  §R{self.input_err}§0"))
+                print(parse_cached(f"  §R{self.input_err}§0"))
 
             try:
                 # get user input
-                raw = input(parse(f"  §{self.color}>§0 "))
+                raw = input(self.input_marker)
 
                 # parse into integer
                 val = int(raw)
 
-                # assert value is valid option
-                assert val in self.options.keys(), "You have entered an option not in the list"
+                # check value is valid option
+                if val not in self.options:
+                    self.input_err = "You have entered an option not in the list"
+                    self.display()
+                    continue
 
                 return val
             except ValueError:
                 self.input_err = "You must enter a numerical number"
                 self.display()
-            except AssertionError as e:
-                self.input_err = str(e)
-                self.display()
             except KeyboardInterrupt:
                 # if user press ctrl-c while undo is allowed, return None
                 if self.allow_undo:
@@ -385,21 +454,24 @@ class ValueInputBox(GeneralUserInterface):
         """
 
         self.clear()
+        output = []
 
-        # print title
+        # add title
         if self.title:
-            print(parse(f"§4§{self.color}{self.title}§0"))
+            output.append(parse_cached(f"§4§{self.color}{self.title}§0"))
 
-        # print description
+        # add description
         if self.description:
-            lines = self.description.splitlines()
-            lines = [parse(f"  " + i) for i in lines]
-            print("\n".join(lines))
+            output += [parse_cached("  " + i) for i in self.description.splitlines()]
         
-        # print prompt and undo_prompt
-        print("  " + self.prompt)
+        # add prompt and undo_prompt
+        output.append("  " + self.prompt)
         if self.allow_undo and self.undo_prompt:
-            print(f"  {self.undo_prompt}")
+            output.append(f"  {self.undo_prompt}")
+
+        # print the whole UI with a single write
+        sys.stdout.write("\n".join(output) + "\n")
+        sys.stdout.flush()
 
     def wait_for_interact(self) -> str | None:
         """
@@ -411,23 +483,22 @@ class ValueInputBox(GeneralUserInterface):
         while True:
             # print input error if applicable
             if self.input_err:
-                print(parse(f"  §R{self.input_err}§0"))
+                print(parse_cached(f"  §R{self.input_err}§0"))
 
             try:
                 # get user input
-                raw = input(parse(f"  §{self.color}>§0 "))
+                raw = input(self.input_marker)
 
                 # validate user input using validator if applicable
                 if self.validator:
                     valid, err_msg = self.validator(raw)
-                    assert valid, err_msg
+                    if not valid:
+                        self.input_err = err_msg
+                        self.display()
+                        continue
 
                 return raw
 
-            except AssertionError as e:
-                self.input_err = str(e)
-                self.display()
-
             except KeyboardInterrupt:
                 # if user press ctrl-c while undo is allowed, return None
                 if self.allow_undo:
@@ -472,26 +543,26 @@ class MessageBox(GeneralUserInterface):
         
         self.clear()
 
-        # print title and description
-        print(parse(f"§4§{self.color}{self.title}§0"))
+        # add title and description
+        output = [parse_cached(f"§4§{self.color}{self.title}§0")]
         description_lines = self.description.splitlines()
-        description = "\n".join("  " + i for i in description_lines)
-        print(description)
-        print("")
-
-        # if hide_options is true, dont print anything else and return
-        if self.hide_options:
-            return
-            
-        # if a list is defined, display those list
-        if type(self.options) == list:
-            print("  Please type a number and hit enter.")
-            for i in range(len(self.options)):
-                print(f"  {i+1} - {self.options[i]}")
-
-        # if one option is defined, display that one option
-        if type(self.options) == str:
-            print(parse(f"  §{self.color}[§4 {self.options} (Press Enter)§0§{self.color}]§0"))
+        output.append("\n".join("  " + i for i in description_lines))
+        output.append("")
+
+        # if hide_options is false, add the options
+        if not self.hide_options:
+            # if a list is defined, add those list
+            if isinstance(self.options, list):
+                output.append("  Please type a number and hit enter.")
+                output += [f"  {i + 1} - {option}" for i, option in enumerate(self.options)]
+
+            # if one option is defined, add that one option
+            if isinstance(self.options, str):
+                output.append(parse_cached(f"  §{self.color}[§4 {self.options} (Press Enter)§0§{self.color}]§0"))
+
+        # print the whole UI with a single write
+        sys.stdout.write("\n".join(output) + "\n")
+        sys.stdout.flush()
 
     def wait_for_interact(self) -> int | None:
         """
@@ -501,7 +572,7 @@ class MessageBox(GeneralUserInterface):
         """
         
         # if only one option is defined, listen for enter
-        if type(self.options) == str:
+        if isinstance(self.options, str):
             try:
                 input()
                 return 1
@@ -509,11 +580,12 @@ class MessageBox(GeneralUserInterface):
                 return None
 
         # if a list is defined, listen for valid input
+        option_count = len(self.options)
         while True:
             if self.input_err:
-                print(parse(f"  §R{self.input_err}§0"))
+                print(parse_cached(f"  §R{self.input_err}§0"))
             try:
-                raw = input(parse(f"  §{self.color}>§0 "))
+                raw = input(self.input_marker)
 
                 # if no option is provided, assume default
                 if not raw.strip():
@@ -523,15 +595,15 @@ class MessageBox(GeneralUserInterface):
                 val = int(raw)
 
                 # check value is valid option
-                assert val > 0, "You have entered an option not in the list"
-                assert val <= len(self.options), "You have entered an option not in the list"
+                if not 0 < val <= option_count:
+                    self.input_err = "You have entered an option not in the list"
+                    self.display()
+                    continue
+
                 return val
             except ValueError:
                 self.input_err = "You must enter a numerical number"
                 self.display()
-            except AssertionError as e:
-                self.input_err = str(e)
-                self.display()
             except KeyboardInterrupt:
                 # if user press ctrl-c, return None
                 return None
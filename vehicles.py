@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from math import ceil, inf
+from math import inf
 
-from locations import CapitalType, City, Country
+from locations import CapitalType, City, Country, distances
 from locations import create_example_countries_and_cities
 
 class Vehicle(ABC):
@@ -18,6 +18,21 @@ class Vehicle(ABC):
         """
         pass
 
+    def compute_travel_times(self, departure: City, arrivals: list[City]) -> list[float]:
+        """
+        Returns the travel durations of direct trips from one city
+        to each of the arrival cities, in the same way as compute_travel_time().
+        Vehicles can override this to compute all the durations at once.
+        """
+        return [self.compute_travel_time(departure, arrival) for arrival in arrivals]
+
+    def can_complete(self, pairs: list[tuple[City, City]]) -> bool:
+        """
+        Returns True if every direct trip in the given list of (departure, arrival) pairs is possible,
+        stopping at the first one that is not.
+        """
+        return all(self.compute_travel_time(departure, arrival) != inf for departure, arrival in pairs)
+
     @abstractmethod
     def __str__(self) -> str:
         """
@@ -46,8 +61,14 @@ class CrappyCrepeCar(Vehicle):
         to another, in hours, rounded up to an integer.
         """
         d = departure.distance(arrival)
-        return ceil(d / self.speed)
+        return -(-d // self.speed) # rounded up using integer division, as the distance is an integer
 
+    def compute_travel_times(self, departure: City, arrivals: list[City]) -> list[float]:
+        """
+        Returns the travel durations of direct trips from one city
+        to each of the arrival cities, in hours, rounded up to integers.
+        """
+        return [-(-d // self.speed) for d in distances(departure, arrivals)]
 
     def __str__(self) -> str:
         """
@@ -83,15 +104,39 @@ class DiplomacyDonutDinghy(Vehicle):
         to another, in hours, rounded up to an integer.
         Returns math.inf if the travel is not possible.
         """
-        in_country = departure.country == arrival.country
+        in_country = departure.country is arrival.country
         # check if impossible
         if not in_country and (
-            departure.capital_type != CapitalType.primary or
-            arrival.capital_type != CapitalType.primary
+            departure.capital_type is not CapitalType.primary or
+            arrival.capital_type is not CapitalType.primary
         ):
             return inf
         d = departure.distance(arrival)
-        return ceil(d / (self.in_country_speed if in_country else self.between_primary_speed))
+        return -(-d // (self.in_country_speed if in_country else self.between_primary_speed)) # rounded up using integer division
+
+    def compute_travel_times(self, departure: City, arrivals: list[City]) -> list[float]:
+        """
+        Returns the travel durations of direct trips from one city
+        to each of the arrival cities, in hours, rounded up to integers.
+        Returns math.inf for the travels that are not possible.
+        """
+        country = departure.country
+        primary = CapitalType.primary
+        departure_primary = departure.capital_type is primary
+
+        # check which travels are possible, and only compute the distances of those
+        in_country = [arrival.country is country for arrival in arrivals]
+        possible = [same_country or (departure_primary and arrival.capital_type is primary)
+                    for arrival, same_country in zip(arrivals, in_country)]
+        d = iter(distances(departure, [arrival for arrival, is_possible in zip(arrivals, possible) if is_possible]))
+
+        result = []
+        for same_country, is_possible in zip(in_country, possible):
+            if not is_possible:
+                result.append(inf)
+            else:
+                result.append(-(-next(d) // (self.in_country_speed if same_country else self.between_primary_speed)))
+        return result
 
     def __str__(self) -> str:
         """
@@ -129,6 +174,14 @@ class TeleportingTarteTrolley(Vehicle):
             return inf
         return self.travel_time
 
+    def compute_travel_times(self, departure: City, arrivals: list[City]) -> list[float]:
+        """
+        Returns the travel durations of direct trips from one city
+        to each of the arrival cities, in hours: the fixed travel time of the trolley
+        for each arrival city within range, math.inf otherwise.
+        """
+        return [inf if d >= self.max_distance else self.travel_time for d in distances(departure, arrivals)]
+
     def __str__(self) -> str:
         """
         Returns the class name and the parameters of the vehicle in parentheses.